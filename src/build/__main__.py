@@ -1,12 +1,12 @@
 # SPDX-License-Identifier: MIT
 
 import argparse
+import collections
 import os
 import sys
-import traceback
 import warnings
 
-from typing import List, Optional, TextIO, Type, Union
+from typing import Dict, List, Optional, TextIO, Type, Union
 
 from build import BuildBackendException, BuildException, ConfigSettings, ProjectBuilder
 from build.env import IsolatedEnvBuilder
@@ -83,6 +83,8 @@ def build(srcdir, outdir, distributions, config_settings=None, isolation=True, s
     except BuildException as e:
         _error(str(e))
     except BuildBackendException as e:
+        import traceback
+
         if sys.version_info >= (3, 5):
             print(traceback.format_exc(-1))
         else:
@@ -151,7 +153,7 @@ def main(cli_args, prog=None):  # type: (List[str], Optional[str]) -> None
     args = parser.parse_args(cli_args)
 
     distributions = []
-    config_settings = {}
+    config_settings = collections.defaultdict(list)  # type: Dict[str, List[str]]
 
     if args.config_setting:
         for arg in args.config_setting:
@@ -166,13 +168,7 @@ def main(cli_args, prog=None):  # type: (List[str], Optional[str]) -> None
             setting = data[0]
             value = data[1] if len(data) >= 2 else ''
 
-            if setting not in config_settings:
-                config_settings[setting] = value
-            else:
-                if not isinstance(config_settings[setting], list):
-                    config_settings[setting] = [config_settings[setting]]
-
-                config_settings[setting].append(value)
+            config_settings[setting].append(value)
 
     if args.sdist:
         distributions.append('sdist')
@@ -183,7 +179,12 @@ def main(cli_args, prog=None):  # type: (List[str], Optional[str]) -> None
     if not distributions:
         distributions = ['sdist', 'wheel']
 
-    build(args.srcdir, args.outdir, distributions, config_settings, not args.no_isolation, args.skip_dependencies)
+    # settings passed only once are handed to the backend as a plain string
+    mapped_settings = {
+        setting: values[0] if len(values) == 1 else values for setting, values in config_settings.items()
+    }  # type: ConfigSettings
+
+    build(args.srcdir, args.outdir, distributions, mapped_settings, not args.no_isolation, args.skip_dependencies)
 
 
 def entrypoint():  # type: () -> None
@@ -67,8 +67,8 @@ class IsolatedEnvBuilder(object):
         :param exc_val: the value of exception raised (if any)
         :param exc_tb: the traceback of exception raised (if any)
         """
-        if self._path is not None and os.path.exists(self._path):  # in case the user already deleted skip remove
-            shutil.rmtree(self._path)
+        if self._path is not None:  # ignore_errors also covers the user having already deleted it
+            shutil.rmtree(self._path, ignore_errors=True)
 
 
 class _IsolatedEnvVenvPip(IsolatedEnv):
@@ -113,26 +113,26 @@ class _IsolatedEnvVenvPip(IsolatedEnv):
         if not requirements:
             return
 
-        with tempfile.NamedTemporaryFile('w+', prefix='build-reqs-', suffix='.txt', delete=False) as req_file:
-            req_file.write(os.linesep.join(requirements))
-        try:
-            cmd = [
-                self._pip_executable,
-                # on python2 if isolation is achieved via environment variables, we need to ignore those while calling
-                # host python (otherwise pip would not be available within it)
-                '-{}m'.format('E' if self._pip_executable == self.executable and sys.version_info[0] == 2 else ''),
-                'pip',
-                'install',
-                '--prefix',
-                self.path,
-                '--ignore-installed',
-                '--no-warn-script-location',
-                '-r',
-                os.path.abspath(req_file.name),
-            ]
-            subprocess.check_call(cmd)
-        finally:
-            os.unlink(req_file.name)
+        # the requirements file lives inside the environment, so it is removed along with it
+        req_file = os.path.join(self.path, 'build-reqs.txt')
+        with open(req_file, 'w') as f:
+            f.write('\n'.join(requirements))
+        cmd = [
+            self._pip_executable,
+            # on python2 if isolation is achieved via environment variables, we need to ignore those while calling
+            # host python (otherwise pip would not be available within it)
+            '-{}m'.format('E' if self._pip_executable == self.executable and sys.version_info[0] == 2 else ''),
+            'pip',
+            'install',
+            '--disable-pip-version-check',
+            '--prefix',
+            self.path,
+            '--ignore-installed',
+            '--no-warn-script-location',
+            '-r',
+            req_file,
+        ]
+        subprocess.check_call(cmd)
 
 
 if sys.version_info[0] == 2:  # noqa: C901 # disable if too complex
@@ -157,6 +157,12 @@ if sys.version_info[0] == 2:  # noqa: C901 # disable if too complex
 
 else:
 
+    # the interpreter name within the venv only depends on the running interpreter
+    _EXECUTABLE_NAME = '{}{}'.format(
+        'pypy3' if platform.python_implementation() == 'PyPy' else 'python',
+        '.exe' if os.name == 'nt' else '',
+    )
+
     def _create_isolated_env(path):  # type: (str) -> Tuple[str, str]
         """
         On Python 3 we use the venv package from the standard library, and if host python has no pip the ensurepip
@@ -184,7 +190,7 @@ else:
             except subprocess.CalledProcessError:  # pragma: no cover
                 pass  # pragma: no cover
             # avoid the setuptools from ensurepip to break the isolation
-            subprocess.check_call([executable, '-Im', 'pip', 'uninstall', 'setuptools', '-y'])
+            subprocess.check_call([executable, '-Im', 'pip', 'uninstall', '--disable-pip-version-check', 'setuptools', '-y'])
             pip_executable = executable
         return executable, pip_executable
 
@@ -195,15 +201,11 @@ else:
         :param path: the location of the virtual environment
         :return: the python executable
         """
-        config_vars = sysconfig.get_config_vars()
-        config_vars['base'] = path
-        env_scripts = sysconfig.get_path('scripts', vars=config_vars)
+        # sysconfig fills in the remaining config vars itself, only override the base
+        env_scripts = sysconfig.get_path('scripts', vars={'base': path})
         if not env_scripts:
             raise RuntimeError("Couldn't get environment scripts path")
-        exe = 'pypy3' if platform.python_implementation() == 'PyPy' else 'python'
-        if os.name == 'nt':
-            exe = '{}.exe'.format(exe)
-        executable = os.path.join(path, env_scripts, exe)
+        executable = os.path.join(path, env_scripts, _EXECUTABLE_NAME)
         if not os.path.exists(executable):
             raise RuntimeError('Virtual environment creation failed, executable {} missing'.format(executable))
         return executable
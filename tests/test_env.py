@@ -37,6 +37,7 @@ def test_isolated_environment_install(mocker):
             '-{}m'.format('E' if env._pip_executable == env._python_executable and sys.version_info[0] == 2 else ''),
             'pip',
             'install',
+            '--disable-pip-version-check',
             '--prefix',
             env.path,
             '--ignore-installed',